@@ -7,6 +7,7 @@ NO TWS/GATEWAY REQUIRED - Uses SnapTrade API directly.
 
 Requirements:
     pip install snaptrade-python-sdk python-dotenv
+    pip install orjson  # optional, faster response parsing
 
 Setup:
     1. Create a .env file with your credentials (or use defaults in script)
@@ -15,14 +16,23 @@ Setup:
     4. Run this script
 """
 
+import atexit
 import csv
+import json
+import logging
 import os
+import queue
 import sys
+import threading
 import time
-from typing import List, Dict, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, List, Dict, Optional
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from pprint import pprint
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -32,12 +42,26 @@ load_dotenv()
 try:
     from snaptrade_client import SnapTrade
     from snaptrade_client.exceptions import ApiException
+    from urllib3.util.retry import Retry
 except ImportError as e:
     print("❌ ERROR: SnapTrade SDK not installed!")
     print("\nPlease install it with:")
     print("    pip install snaptrade-python-sdk python-dotenv")
     sys.exit(1)
 
+# Optional: faster JSON decoding of SDK responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: vectorized CSV parsing for large order files
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pa_csv = None
+
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
@@ -47,6 +71,12 @@ SNAPTRADE_CLIENT_ID = os.getenv("SNAPTRADE_CLIENT_ID", "EVIEW-TECHNOLOGIES-TEST-
 SNAPTRADE_CONSUMER_KEY = os.getenv("SNAPTRADE_CONSUMER_KEY", "jqRizEpeIjBBibDkw6X7rZ0JjIjXt9XwnOmj7ay50gczEbfO5N")
 SNAPTRADE_USER_ID = os.getenv("SNAPTRADE_USER_ID", "user_test_2")
 SNAPTRADE_USER_SECRET = os.getenv("SNAPTRADE_USER_SECRET", "f1df792c-8338-4a4b-9e6c-4139e455dd79")
+_REQUIRED_CREDENTIALS = (
+    "SNAPTRADE_CLIENT_ID",
+    "SNAPTRADE_CONSUMER_KEY",
+    "SNAPTRADE_USER_ID",
+    "SNAPTRADE_USER_SECRET",
+)
 
 # File Paths
 CSV_INPUT_FILE = os.getenv("CSV_INPUT_FILE", "orders.csv")
@@ -54,54 +84,185 @@ CSV_INPUT_FILE = os.getenv("CSV_INPUT_FILE", "orders.csv")
 # Options
 DRY_RUN = os.getenv("DRY_RUN", "True").lower() == "true"
 VERBOSE = os.getenv("VERBOSE", "True").lower() == "true"
+VALIDATE_SYMBOLS = os.getenv("VALIDATE_SYMBOLS", "False").lower() == "true"  # Resolve symbols in dry run
+COALESCE = os.getenv("COALESCE", "False").lower() == "true"  # Merge duplicate rows before submitting
+MAX_WORKERS = int(os.getenv("MAX_WORKERS", "8"))
+RATE_LIMIT = float(os.getenv("RATE_LIMIT", "4"))  # Max API calls per second
+ORDER_QUEUE_SIZE = 64  # Max parsed orders waiting for a worker
+CSV_BLOCK_SIZE = 8 << 20  # Bytes pyarrow parses per batch when streaming the CSV
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()  # WARNING hides per-order progress
+REFRESH = os.getenv("REFRESH", "False").lower() == "true"  # Ignore the cached account list
+CACHE_DIR = Path(os.getenv("CACHE_DIR", Path.home() / ".cache" / "snaptrade-bridge")).expanduser()
+ACCOUNTS_CACHE_TTL = 24 * 3600  # Seconds; linked accounts rarely change
+
+# CSV schema
+_REQUIRED_COLUMNS = ('Action', 'Quantity', 'Symbol')
+_VALID_ACTIONS = frozenset({'BUY', 'SELL'})
+
+# CSV → SnapTrade enum mappings
+_ORDER_TYPE_MAP = {
+    'MKT': 'Market',
+    'LMT': 'Limit',
+    'STP': 'Stop',
+    'MARKET': 'Market',
+    'LIMIT': 'Limit',
+    'STOP': 'Stop',
+}
+_TIF_MAP = {
+    'DAY': 'Day',
+    'GTC': 'GTC',
+    'IOC': 'IOC',
+    'FOK': 'FOK',
+}
+
+# ═══════════════════════════════════════════════════════════════════
+# LOGGING CONFIGURATION
+# ═══════════════════════════════════════════════════════════════════
+
+# Worker threads only enqueue records; a single listener thread writes them,
+# so concurrent orders never contend on the stdout lock.
+logger = logging.getLogger(__name__)
+logger.propagate = False
+_log_queue: queue.Queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+try:
+    logger.setLevel(LOG_LEVEL)
+except ValueError:
+    logger.setLevel(logging.INFO)
+    logger.warning("⚠️  Unknown LOG_LEVEL %r; using INFO", LOG_LEVEL)
+
+# ═══════════════════════════════════════════════════════════════════
+# SDK TUNING
+# ═══════════════════════════════════════════════════════════════════
+
+def install_fast_json():
+    """Decode SnapTrade response bodies with orjson when it is installed."""
+    if orjson is None:
+        return
+    try:
+        from snaptrade_client import api_client
+    except ImportError:
+        return
+    response_cls = getattr(api_client, 'OpenApiResponse', None)
+    if response_cls is not None and hasattr(response_cls, '_OpenApiResponse__deserialize_json'):
+        response_cls._OpenApiResponse__deserialize_json = staticmethod(orjson.loads)
+
+install_fast_json()
 
 # ═══════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
 
 def print_header(title: str):
-    """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    """Log a formatted header."""
+    logger.info("\n" + "=" * 70 + f"\n  {title}\n" + "=" * 70)
 
 def print_section(title: str):
-    """Print a formatted section."""
-    print(f"\n--- {title} ---")
+    """Log a formatted section."""
+    logger.info(f"\n--- {title} ---")
 
 def validate_credentials():
     """Validate that all required credentials are present."""
     print_header("Validating Credentials")
     
-    required_vars = {
-        "SNAPTRADE_CLIENT_ID": SNAPTRADE_CLIENT_ID,
-        "SNAPTRADE_CONSUMER_KEY": SNAPTRADE_CONSUMER_KEY,
-        "SNAPTRADE_USER_ID": SNAPTRADE_USER_ID,
-        "SNAPTRADE_USER_SECRET": SNAPTRADE_USER_SECRET,
-    }
-    
-    missing = [key for key, value in required_vars.items() if not value]
+    config = globals()
+    missing = [key for key in _REQUIRED_CREDENTIALS if not config[key]]
     
     if missing:
-        print(f"❌ Missing required environment variables:")
+        logger.error("❌ Missing required environment variables:")
         for var in missing:
-            print(f"   - {var}")
-        print("\nPlease check your .env file!")
+            logger.error(f"   - {var}")
+        logger.error("\nPlease check your .env file!")
         return False
     
-    print("✅ All credentials present")
+    logger.info("✅ All credentials present")
     if VERBOSE:
-        print(f"   Client ID: {SNAPTRADE_CLIENT_ID[:20]}...")
-        print(f"   User ID: {SNAPTRADE_USER_ID}")
+        logger.info(f"   Client ID: {SNAPTRADE_CLIENT_ID[:20]}...")
+        logger.info(f"   User ID: {SNAPTRADE_USER_ID}")
     return True
 
+# ═══════════════════════════════════════════════════════════════════
+# DATA MODELS
+# ═══════════════════════════════════════════════════════════════════
+
+@dataclass(slots=True)
+class CsvOrder:
+    """A typed order parsed from one CSV row."""
+    action: str
+    quantity: float
+    symbol: str
+    sec_type: str
+    exchange: str
+    currency: str
+    time_in_force: str  # SnapTrade enum, e.g. 'Day'
+    order_type: str  # SnapTrade enum, e.g. 'Market'
+    lmt_price: Optional[float]
+    aux_price: Optional[float]
+    account: str
+    row_number: int
+    
+    def validation_error(self) -> Optional[str]:
+        """Return why this order is invalid, or None if it can be placed."""
+        if not self.symbol or self.quantity <= 0:
+            return "Invalid data"
+        if self.action not in _VALID_ACTIONS:
+            return f"Invalid action '{self.action}'"
+        return None
+
 # ═══════════════════════════════════════════════════════════════════
 # CSV READER
 # ═══════════════════════════════════════════════════════════════════
 
-def read_orders_from_csv(filepath: str) -> List[Dict]:
+def _read_csv_rows(csv_path: Path) -> Iterator[List[str]]:
+    """
+    Yield the header and then every row as a list of strings.
+    Streams the file through pyarrow's C++ parser one block at a time when
+    installed, falling back to csv.reader (mid-file too, if a later block is rejected).
     """
-    Read orders from CSV file.
+    with open(csv_path, 'r', encoding='utf-8', newline='') as csvfile:
+        header = next(csv.reader(csvfile), None)
+    
+    streamed = None  # Data rows already yielded by pyarrow
+    if pa_csv is not None and header:
+        try:
+            # Keep every column as text so normalization below stays identical
+            batches = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                ),
+            )
+        except pa.ArrowInvalid:
+            batches = None  # Ragged or unusual file; let csv.reader handle it
+        
+        if batches is not None:
+            yield header
+            streamed = 0
+            try:
+                for batch in batches:
+                    for row in zip(*(column.to_pylist() for column in batch.columns)):
+                        streamed += 1
+                        yield list(row)
+                return
+            except pa.ArrowInvalid:
+                pass  # A later block is malformed; resume after the rows already yielded
+    
+    with open(csv_path, 'r', encoding='utf-8', newline='') as csvfile:
+        rows = csv.reader(csvfile)
+        if streamed is not None:
+            next(rows, None)  # Header already yielded
+            # pyarrow skips blank lines, so only count non-empty rows
+            rows = islice(filter(None, rows), streamed, None)
+        yield from rows
+
+def iter_orders_from_csv(filepath: str) -> Iterator[CsvOrder]:
+    """
+    Stream validated orders from CSV file, one row at a time.
     Expected columns: Action, Quantity, Symbol, SecType, Exchange, Currency, 
                      TimeInForce, OrderType, LmtPrice, AuxPrice, Account
     """
@@ -109,56 +270,197 @@ def read_orders_from_csv(filepath: str) -> List[Dict]:
     
     csv_path = Path(filepath)
     if not csv_path.exists():
-        print(f"❌ CSV file not found: {filepath}")
-        print(f"\nCreate a CSV file with columns:")
-        print(f"  Action,Quantity,Symbol,SecType,Exchange,Currency,TimeInForce,OrderType,LmtPrice,AuxPrice,Account")
-        return []
+        logger.error(f"❌ CSV file not found: {filepath}")
+        logger.error(f"\nCreate a CSV file with columns:")
+        logger.error(f"  Action,Quantity,Symbol,SecType,Exchange,Currency,TimeInForce,OrderType,LmtPrice,AuxPrice,Account")
+        return
     
-    orders = []
     try:
-        with open(csv_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+        reader = _read_csv_rows(csv_path)
+        header = next(reader, None)
+        if not header:
+            logger.error("❌ CSV file is empty or has no headers")
+            return
+        
+        # Resolve column positions once instead of hashing names per row
+        columns = {name.strip(): i for i, name in enumerate(header)}
+        missing = [name for name in _REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            logger.error(f"❌ CSV missing required column(s): {', '.join(missing)}")
+            return
+        
+        i_action = columns['Action']
+        i_quantity = columns['Quantity']
+        i_symbol = columns['Symbol']
+        i_sec_type = columns.get('SecType')
+        i_exchange = columns.get('Exchange')
+        i_currency = columns.get('Currency')
+        i_tif = columns.get('TimeInForce')
+        i_order_type = columns.get('OrderType')
+        i_lmt_price = columns.get('LmtPrice')
+        i_aux_price = columns.get('AuxPrice')
+        i_account = columns.get('Account')
+        width = len(header)
+        
+        _strip = str.strip
+        _upper = str.upper
+        _float = float
+        _order_type = _ORDER_TYPE_MAP.get
+        _tif = _TIF_MAP.get
+        _info = logger.info
+        _warning = logger.warning
+        
+        row_num = 1
+        for row in reader:
+            if not row:
+                continue  # Blank line
+            row_num += 1
+            if len(row) < width:
+                row.extend([''] * (width - len(row)))
             
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    # Parse order data
-                    order = {
-                        'action': row['Action'].strip().upper(),
-                        'quantity': float(row['Quantity'].strip()),
-                        'symbol': row['Symbol'].strip().upper(),
-                        'sec_type': row.get('SecType', 'STK').strip().upper(),
-                        'exchange': row.get('Exchange', 'SMART').strip().upper().split('/')[0],
-                        'currency': row.get('Currency', 'USD').strip().upper(),
-                        'time_in_force': row.get('TimeInForce', 'DAY').strip().upper(),
-                        'order_type': row.get('OrderType', 'MKT').strip().upper(),
-                        'lmt_price': float(row['LmtPrice'].strip()) if row.get('LmtPrice', '').strip() else None,
-                        'aux_price': float(row['AuxPrice'].strip()) if row.get('AuxPrice', '').strip() else None,
-                        'account': row.get('Account', '').strip(),
-                        'row_number': row_num
-                    }
-                    
-                    # Validate required fields
-                    if not order['symbol'] or order['quantity'] <= 0:
-                        print(f"   ⚠️  Row {row_num}: Invalid data, skipping")
-                        continue
-                    
-                    if order['action'] not in ['BUY', 'SELL']:
-                        print(f"   ⚠️  Row {row_num}: Invalid action '{order['action']}', skipping")
-                        continue
-                    
-                    orders.append(order)
-                    print(f"   ✅ Row {row_num}: {order['action']} {order['quantity']} {order['symbol']}")
-                    
-                except (ValueError, KeyError) as e:
-                    print(f"   ⚠️  Row {row_num}: Error parsing - {str(e)}")
+            # Cheapest rejection first: no symbol means nothing else matters
+            symbol = _upper(_strip(row[i_symbol]))
+            if not symbol:
+                _warning("   ⚠️  Row %d: Invalid data, skipping", row_num)
+                continue
+            
+            try:
+                # Parse order data
+                lmt_price = _strip(row[i_lmt_price]) if i_lmt_price is not None else ''
+                aux_price = _strip(row[i_aux_price]) if i_aux_price is not None else ''
+                order = CsvOrder(
+                    action=_upper(_strip(row[i_action])),
+                    quantity=_float(row[i_quantity]),
+                    symbol=symbol,
+                    sec_type=_upper(_strip(row[i_sec_type])) if i_sec_type is not None else 'STK',
+                    exchange=_upper(_strip(row[i_exchange])).partition('/')[0] if i_exchange is not None else 'SMART',
+                    currency=_upper(_strip(row[i_currency])) if i_currency is not None else 'USD',
+                    time_in_force=_tif(_upper(_strip(row[i_tif])), 'Day') if i_tif is not None else 'Day',
+                    order_type=_order_type(_upper(_strip(row[i_order_type])), 'Market') if i_order_type is not None else 'Market',
+                    lmt_price=_float(lmt_price) if lmt_price else None,
+                    aux_price=_float(aux_price) if aux_price else None,
+                    account=_strip(row[i_account]) if i_account is not None else '',
+                    row_number=row_num,
+                )
+                
+                # Validate required fields
+                error = order.validation_error()
+                if error:
+                    _warning(f"   ⚠️  Row {row_num}: {error}, skipping")
                     continue
-        
-        print(f"\n✅ Loaded {len(orders)} valid order(s) from CSV")
-        return orders
+                
+                _info("   ✅ Row %d: %s %s %s", row_num, order.action, order.quantity, order.symbol)
+                yield order
+                
+            except ValueError as e:
+                _warning(f"   ⚠️  Row {row_num}: Error parsing - {str(e)}")
+                continue
         
     except Exception as e:
-        print(f"❌ Error reading CSV: {str(e)}")
-        return []
+        logger.error(f"❌ Error reading CSV: {str(e)}")
+
+def coalesce_orders(orders: Iterator[CsvOrder]) -> List[CsvOrder]:
+    """
+    Merge orders that differ only in quantity into one order per
+    (account, symbol, action, type, prices, TIF), keeping the earliest row.
+    """
+    merged: Dict[tuple, CsvOrder] = {}
+    count = 0
+    for count, order in enumerate(orders, 1):
+        key = (order.account, order.symbol, order.action, order.order_type,
+               order.lmt_price, order.aux_price, order.time_in_force)
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = order
+        else:
+            merged[key] = replace(existing, quantity=existing.quantity + order.quantity)
+    
+    if count > len(merged):
+        logger.info(f"🔗 Coalesced {count} order(s) into {len(merged)}")
+    return list(merged.values())
+
+# ═══════════════════════════════════════════════════════════════════
+# ACCOUNT CACHE
+# ═══════════════════════════════════════════════════════════════════
+
+_ACCOUNTS_CACHE_FILE = CACHE_DIR / "accounts.json"
+_CACHED_ACCOUNT_FIELDS = ('id', 'name', 'type', 'number', 'institution_name')
+
+def load_cached_accounts(user_id: str) -> Optional[List[Dict]]:
+    """Return the cached account list for this user, or None if missing/stale."""
+    try:
+        with open(_ACCOUNTS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get('user_id') != user_id:
+        return None
+    if time.time() - cached.get('saved_at', 0) > ACCOUNTS_CACHE_TTL:
+        return None
+    return cached.get('accounts') or None
+
+def save_cached_accounts(user_id: str, accounts: List[Dict]):
+    """Persist the fields we use from each account; failures are non-fatal."""
+    slim = [
+        {field: account.get(field) for field in _CACHED_ACCOUNT_FIELDS if account.get(field) is not None}
+        for account in accounts
+    ]
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_ACCOUNTS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'user_id': user_id, 'saved_at': time.time(), 'accounts': slim}, f, default=str)
+    except OSError as e:
+        logger.warning(f"⚠️  Could not write account cache: {e}")
+
+# ═══════════════════════════════════════════════════════════════════
+# RATE LIMITING
+# ═══════════════════════════════════════════════════════════════════
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Allows bursts up to `capacity` calls and refills at `rate` tokens/sec,
+    so callers only block when the bucket is actually empty.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# ═══════════════════════════════════════════════════════════════════
+# DRY RUN PREVIEW
+# ═══════════════════════════════════════════════════════════════════
+
+def preview_order(csv_order: CsvOrder):
+    """Log the order that would be placed; needs no SnapTrade client."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    lines = [
+        "      🔵 [DRY RUN] Would place order via SnapTrade:",
+        f"         {csv_order.action} {csv_order.quantity} {csv_order.symbol}",
+        f"         Type: {csv_order.order_type} | TIF: {csv_order.time_in_force}",
+    ]
+    if csv_order.lmt_price:
+        lines.append(f"         Limit Price: ${csv_order.lmt_price}")
+    logger.info("\n".join(lines))
 
 # ═══════════════════════════════════════════════════════════════════
 # SNAPTRADE CLIENT
@@ -175,6 +477,33 @@ class SnapTradeManager:
         )
         self.user_id = SNAPTRADE_USER_ID
         self.user_secret = SNAPTRADE_USER_SECRET
+        self.rate_limiter = TokenBucket(RATE_LIMIT)
+        self._symbol_cache: Dict[tuple, Optional[str]] = {}
+        self._symbol_locks: Dict[tuple, threading.Lock] = {}
+        self._symbol_cache_lock = threading.Lock()
+        self._configure_connection_pool()
+    
+    def _configure_connection_pool(self):
+        """
+        Tune the SDK's shared urllib3 pool so worker threads reuse keep-alive
+        connections instead of paying a new TLS handshake per request.
+        """
+        rest_client = getattr(self.client.api_status.api_client, 'rest_client', None)
+        pool_manager = getattr(rest_client, 'pool_manager', None)
+        if pool_manager is None:
+            return
+        
+        pool_manager.connection_pool_kw.update(
+            maxsize=max(MAX_WORKERS, 4),
+            block=True,  # Wait for a warm socket instead of opening throwaway ones
+            retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,  # Let the SDK raise ApiException
+            ),
+        )
+        pool_manager.clear()  # Drop pools created with the old settings
     
     def test_connection(self) -> bool:
         """Test API connection."""
@@ -182,144 +511,190 @@ class SnapTradeManager:
         try:
             response = self.client.api_status.check()
             if VERBOSE:
-                print("✅ SnapTrade API Status:")
-                pprint(response.body)
+                from pprint import pformat
+                logger.info("✅ SnapTrade API Status:\n%s", pformat(response.body))
             else:
-                print("✅ Connected to SnapTrade API")
+                logger.info("✅ Connected to SnapTrade API")
             return True
         except Exception as e:
-            print(f"❌ Failed to connect to SnapTrade: {str(e)}")
+            logger.error(f"❌ Failed to connect to SnapTrade: {str(e)}")
             return False
     
+    def warm_connections(self, count: int):
+        """
+        Open `count` pooled connections up front with concurrent status checks,
+        so the first burst of worker requests doesn't pay for TLS handshakes.
+        """
+        if count <= 1:
+            return  # test_connection already warmed one socket
+        
+        def _ping(_):
+            self.rate_limiter.acquire()
+            try:
+                self.client.api_status.check()
+            except Exception:
+                pass  # Best effort; real requests will report errors
+        
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(_ping, range(count)))
+    
     def get_user_accounts(self) -> List[Dict]:
         """Fetch all linked brokerage accounts for the user."""
         print_section("Fetching User Accounts")
         try:
-            response = self.client.account_information.list_user_accounts(
-                user_id=self.user_id,
-                user_secret=self.user_secret
-            )
-            
-            accounts = response.body if response.body else []
+            accounts = None if REFRESH else load_cached_accounts(self.user_id)
+            if accounts:
+                logger.info("💾 Using cached account list (set REFRESH=True to refetch)")
+            else:
+                response = self.client.account_information.list_user_accounts(
+                    user_id=self.user_id,
+                    user_secret=self.user_secret
+                )
+                accounts = response.body if response.body else []
+                if accounts:
+                    save_cached_accounts(self.user_id, accounts)
             
             if not accounts:
-                print("⚠️  No accounts found!")
-                print("\n📝 To link a brokerage account:")
-                print("   1. Go to: https://app.snaptrade.com/")
-                print("   2. Log in with your SnapTrade account")
-                print("   3. Click 'Connect Brokerage'")
-                print("   4. Choose your broker (e.g., Interactive Brokers)")
-                print("   5. Follow the OAuth flow to authorize")
-                print("   6. Run this script again")
+                logger.warning(
+                    "⚠️  No accounts found!\n"
+                    "\n📝 To link a brokerage account:\n"
+                    "   1. Go to: https://app.snaptrade.com/\n"
+                    "   2. Log in with your SnapTrade account\n"
+                    "   3. Click 'Connect Brokerage'\n"
+                    "   4. Choose your broker (e.g., Interactive Brokers)\n"
+                    "   5. Follow the OAuth flow to authorize\n"
+                    "   6. Run this script again"
+                )
                 return []
             
-            print(f"✅ Found {len(accounts)} account(s):")
-            for idx, account in enumerate(accounts, 1):
-                print(f"   {idx}. {account.get('name', 'N/A')} (ID: {account.get('id', 'N/A')})")
-                print(f"      Type: {account.get('type', 'N/A')}")
-                print(f"      Number: {account.get('number', 'N/A')}")
-                if account.get('institution_name'):
-                    print(f"      Institution: {account.get('institution_name')}")
+            if logger.isEnabledFor(logging.INFO):
+                lines = [f"✅ Found {len(accounts)} account(s):"]
+                for idx, account in enumerate(accounts, 1):
+                    lines.append(f"   {idx}. {account.get('name', 'N/A')} (ID: {account.get('id', 'N/A')})")
+                    lines.append(f"      Type: {account.get('type', 'N/A')}")
+                    lines.append(f"      Number: {account.get('number', 'N/A')}")
+                    if account.get('institution_name'):
+                        lines.append(f"      Institution: {account.get('institution_name')}")
+                logger.info("\n".join(lines))
             
             return accounts
             
         except ApiException as e:
-            print(f"❌ API Error fetching accounts: {e}")
-            if hasattr(e, 'body'):
-                pprint(e.body)
+            logger.error("❌ API Error fetching accounts: %s", getattr(e, 'body', e))
+            if VERBOSE and logger.isEnabledFor(logging.DEBUG):
+                from pprint import pformat
+                logger.debug(pformat(getattr(e, 'body', None)))
             return []
         except Exception as e:
-            print(f"❌ Error fetching accounts: {str(e)}")
+            logger.error(f"❌ Error fetching accounts: {str(e)}")
             return []
     
     def search_symbol(self, symbol: str, account_id: str) -> Optional[str]:
-        """Search for a symbol and return its universal_symbol_id."""
-        try:
-            # Use symbol search endpoint (works on FREE plan)
-            response = self.client.reference_data.symbol_search_user_account(
-                user_id=self.user_id,
-                user_secret=self.user_secret,
-                account_id=account_id,
-                substring=symbol
-            )
+        """
+        Search for a symbol and return its universal_symbol_id.
+        Results (including "not found") are cached per account for the run;
+        concurrent lookups of the same symbol share a single API call.
+        """
+        key = (account_id, symbol.upper())
+        with self._symbol_cache_lock:
+            if key in self._symbol_cache:
+                return self._symbol_cache[key]
+            key_lock = self._symbol_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            if key in self._symbol_cache:
+                return self._symbol_cache[key]
             
-            if response.body and len(response.body) > 0:
-                # Find exact match or first result
-                for sym in response.body:
-                    symbol_name = sym.get('symbol', '').upper()
-                    if symbol_name == symbol.upper():
-                        symbol_id = sym.get('id')
-                        if symbol_id:
-                            if VERBOSE:
-                                print(f"      Symbol {symbol} → ID: {symbol_id}")
-                            return symbol_id
-                
-                # Use first result if no exact match
-                symbol_id = response.body[0].get('id')
-                if symbol_id:
-                    if VERBOSE:
-                        print(f"      Symbol {symbol} → ID: {symbol_id} (first match)")
-                    return symbol_id
-                else:
-                    print(f"      ⚠️  Symbol ID not found for: {symbol}")
-                    return None
-            else:
-                print(f"      ⚠️  Symbol not found: {symbol}")
+            try:
+                symbol_id = self._lookup_symbol(symbol, account_id)
+            except Exception as e:
+                # Transient failures are not cached so a later order can retry
+                logger.error(f"      ❌ Error searching symbol {symbol}: {str(e)}")
                 return None
-                
-        except Exception as e:
-            print(f"      ❌ Error searching symbol {symbol}: {str(e)}")
+            
+            with self._symbol_cache_lock:
+                self._symbol_cache[key] = symbol_id
+            return symbol_id
+    
+    def preload_symbols(self, orders: Iterator[CsvOrder], account_id: str) -> Iterator[CsvOrder]:
+        """
+        Pass orders through unchanged, starting a background lookup for each
+        new symbol as it streams past, so workers usually find it cached.
+        """
+        seen = set()
+        with ThreadPoolExecutor(max_workers=max(1, min(4, MAX_WORKERS))) as executor:
+            for csv_order in orders:
+                if csv_order.symbol not in seen:
+                    seen.add(csv_order.symbol)
+                    executor.submit(self.search_symbol, csv_order.symbol, account_id)
+                yield csv_order
+    
+    def _lookup_symbol(self, symbol: str, account_id: str) -> Optional[str]:
+        """Query SnapTrade for a symbol's universal_symbol_id (uncached)."""
+        verbose = VERBOSE
+        
+        # Use symbol search endpoint (works on FREE plan)
+        self.rate_limiter.acquire()
+        response = self.client.reference_data.symbol_search_user_account(
+            user_id=self.user_id,
+            user_secret=self.user_secret,
+            account_id=account_id,
+            substring=symbol
+        )
+        
+        results = response.body
+        if not results:
+            logger.warning(f"      ⚠️  Symbol not found: {symbol}")
             return None
+        
+        # Prefer an exact ticker match (symbol is upper-cased by the CSV reader),
+        # otherwise fall back to the first result
+        exact = next(
+            (sym for sym in results if sym.get('id') and sym.get('symbol', '').upper() == symbol),
+            None
+        )
+        if exact is not None:
+            if verbose:
+                logger.info("      Symbol %s → ID: %s", symbol, exact['id'])
+            return exact['id']
+        
+        symbol_id = results[0].get('id')
+        if symbol_id:
+            if verbose:
+                logger.info("      Symbol %s → ID: %s (first match)", symbol, symbol_id)
+            return symbol_id
+        
+        logger.warning(f"      ⚠️  Symbol ID not found for: {symbol}")
+        return None
     
-    def place_order_from_csv(self, account_id: str, csv_order: Dict) -> bool:
+    def place_order_from_csv(self, account_id: str, csv_order: CsvOrder) -> bool:
         """Place an order from CSV data using SnapTrade API."""
         try:
-            symbol = csv_order['symbol']
-            action = csv_order['action']
-            quantity = csv_order['quantity']
-            order_type = csv_order['order_type']
-            lmt_price = csv_order.get('lmt_price')
-            tif = csv_order.get('time_in_force', 'Day')
+            symbol = csv_order.symbol
+            action = csv_order.action
+            quantity = csv_order.quantity
+            snaptrade_order_type = csv_order.order_type  # Mapped by the CSV reader
+            snaptrade_tif = csv_order.time_in_force
+            lmt_price = csv_order.lmt_price
             
-            print(f"      Searching for symbol: {symbol}")
-            
-            # Search for symbol to get universal_symbol_id
-            symbol_id = self.search_symbol(symbol, account_id)
-            if not symbol_id:
-                return False
-            
-            # Map order type
-            order_type_map = {
-                'MKT': 'Market',
-                'LMT': 'Limit',
-                'STP': 'Stop',
-                'MARKET': 'Market',
-                'LIMIT': 'Limit',
-                'STOP': 'Stop'
-            }
-            snaptrade_order_type = order_type_map.get(order_type, 'Market')
-            
-            # Map time in force
-            tif_map = {
-                'DAY': 'Day',
-                'GTC': 'GTC',
-                'IOC': 'IOC',
-                'FOK': 'FOK'
-            }
-            snaptrade_tif = tif_map.get(tif, 'Day')
+            # Dry runs only resolve symbols when explicitly asked to
+            symbol_id = None
+            if not DRY_RUN or VALIDATE_SYMBOLS:
+                logger.info("      Searching for symbol: %s", symbol)
+                
+                # Search for symbol to get universal_symbol_id
+                symbol_id = self.search_symbol(symbol, account_id)
+                if not symbol_id:
+                    return False
             
             if DRY_RUN:
-                print(f"      🔵 [DRY RUN] Would place order via SnapTrade:")
-                print(f"         {action} {quantity} {symbol}")
-                print(f"         Type: {snaptrade_order_type} | TIF: {snaptrade_tif}")
-                if lmt_price:
-                    print(f"         Limit Price: ${lmt_price}")
+                preview_order(csv_order)
                 return True
             
             # Prepare order payload for SnapTrade
             order_data = {
                 'account_id': account_id,
-                'action': action.upper(),  # BUY or SELL (ALL CAPS)
+                'action': action,  # BUY or SELL (upper-cased by the CSV reader)
                 'order_type': snaptrade_order_type,
                 'time_in_force': snaptrade_tif,
                 'universal_symbol_id': symbol_id,
@@ -330,9 +705,10 @@ class SnapTradeManager:
             if snaptrade_order_type == 'Limit' and lmt_price:
                 order_data['price'] = float(lmt_price)
             
-            print(f"      📤 Placing order via SnapTrade...")
+            logger.info("      📤 Placing order via SnapTrade...")
             
             # Place order through SnapTrade
+            self.rate_limiter.acquire()
             response = self.client.trading.place_force_order(
                 user_id=self.user_id,
                 user_secret=self.user_secret,
@@ -341,34 +717,68 @@ class SnapTradeManager:
             
             if response.body:
                 order_result = response.body
-                print(f"      ✅ Order placed successfully!")
-                print(f"         Order ID: {order_result.get('id', 'N/A')}")
-                print(f"         Status: {order_result.get('status', 'N/A')}")
+                logger.info(
+                    "      ✅ Order placed successfully!\n"
+                    "         Order ID: %s\n"
+                    "         Status: %s",
+                    order_result.get('id', 'N/A'), order_result.get('status', 'N/A'),
+                )
                 return True
             else:
-                print(f"      ❌ Order placement failed")
+                logger.error(f"      ❌ Order placement failed")
                 return False
                 
         except ApiException as e:
-            print(f"      ❌ API Error: {e}")
-            if hasattr(e, 'body'):
-                pprint(e.body)
+            logger.error("      ❌ API Error: %s", getattr(e, 'body', e))
+            if getattr(e, 'status', None) in (401, 403):
+                logger.error("      If this account was unlinked, rerun with REFRESH=True to refetch accounts")
+            if VERBOSE and logger.isEnabledFor(logging.DEBUG):
+                from pprint import pformat
+                logger.debug(pformat(getattr(e, 'body', None)))
             return False
         except Exception as e:
-            print(f"      ❌ Error placing order: {str(e)}")
+            logger.error(f"      ❌ Error placing order: {str(e)}")
             return False
 
 # ═══════════════════════════════════════════════════════════════════
 # MAIN EXECUTION
 # ═══════════════════════════════════════════════════════════════════
 
+def process_order(snaptrade: SnapTradeManager, account_id: Optional[str], csv_order: CsvOrder, idx: int) -> bool:
+    """Process a single CSV order (runs inside a worker thread)."""
+    logger.info(
+        "\n[%d] Processing order from row %d:\n"
+        "   %s %s %s\n"
+        "   Type: %s | TIF: %s",
+        idx, csv_order.row_number,
+        csv_order.action, csv_order.quantity, csv_order.symbol,
+        csv_order.order_type, csv_order.time_in_force,
+    )
+    return snaptrade.place_order_from_csv(account_id, csv_order)
+
+def order_worker(snaptrade: SnapTradeManager, account_id: Optional[str], order_queue: queue.Queue,
+                 counts: Counter, counts_lock: threading.Lock):
+    """Consume orders from the queue until a None sentinel is received."""
+    while True:
+        item = order_queue.get()
+        if item is None:
+            return
+        idx, csv_order = item
+        try:
+            ok = process_order(snaptrade, account_id, csv_order, idx)
+        except Exception as e:
+            logger.error(f"      ❌ Unexpected error on row {csv_order.row_number}: {str(e)}")
+            ok = False
+        with counts_lock:
+            counts['successful' if ok else 'failed'] += 1
+
 def main():
     """Main execution flow."""
     print_header("CSV to IBKR via SnapTrade API")
-    print(f"Mode: {'DRY RUN (No actual orders)' if DRY_RUN else 'LIVE TRADING'}")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("\n💡 Orders will be placed through SnapTrade API")
-    print("   No need to run TWS/Gateway!")
+    logger.info(f"Mode: {'DRY RUN (No actual orders)' if DRY_RUN else 'LIVE TRADING'}")
+    logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("\n💡 Orders will be placed through SnapTrade API")
+    logger.info("   No need to run TWS/Gateway!")
     
     # Step 1: Validate credentials
     if not validate_credentials():
@@ -378,52 +788,74 @@ def main():
     print_header("Initializing SnapTrade")
     snaptrade = SnapTradeManager()
     
-    if not snaptrade.test_connection():
-        return 1
+    # Dry runs without symbol validation never need the API, so don't touch it
+    account_id = None
+    if DRY_RUN and not VALIDATE_SYMBOLS:
+        logger.info("🔵 Dry run: skipping SnapTrade connection and account lookup")
+    else:
+        # Step 3: Get user accounts while the connection test is in flight
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            connected = executor.submit(snaptrade.test_connection)
+            accounts = executor.submit(snaptrade.get_user_accounts).result()
+            if not connected.result():
+                return 1
+        if not accounts:
+            return 1
+        
+        account_id = accounts[0]['id']
+        account_name = accounts[0].get('name', 'N/A')
+        logger.info(f"\n   Using account: {account_name}")
+        
+        snaptrade.warm_connections(max(1, MAX_WORKERS))
     
-    # Step 3: Get user accounts
-    accounts = snaptrade.get_user_accounts()
-    if not accounts:
-        return 1
+    # Step 4/5: Stream orders from CSV into worker threads as they are parsed
+    print_header("Processing Orders via SnapTrade API")
+    order_queue: queue.Queue = queue.Queue(maxsize=ORDER_QUEUE_SIZE)
+    counts: Counter = Counter()
+    counts_lock = threading.Lock()
+    workers = [
+        threading.Thread(
+            target=order_worker,
+            args=(snaptrade, account_id, order_queue, counts, counts_lock),
+            daemon=True,
+        )
+        for _ in range(max(1, MAX_WORKERS))
+    ]
+    for worker in workers:
+        worker.start()
     
-    account_id = accounts[0]['id']
-    account_name = accounts[0].get('name', 'N/A')
-    print(f"\n   Using account: {account_name}")
+    orders = iter_orders_from_csv(CSV_INPUT_FILE)
+    if COALESCE:
+        orders = coalesce_orders(orders)  # Needs the whole file before submitting
+    if account_id is not None:
+        orders = snaptrade.preload_symbols(orders, account_id)  # Only set when symbols get resolved
     
-    # Step 4: Read orders from CSV
-    orders = read_orders_from_csv(CSV_INPUT_FILE)
+    total = 0
+    for total, csv_order in enumerate(orders, 1):
+        order_queue.put((total, csv_order))
     
-    if not orders:
-        print("\n❌ No valid orders found in CSV file")
-        return 1
+    for _ in workers:
+        order_queue.put(None)
+    for worker in workers:
+        worker.join()
     
-    # Step 5: Process each order through SnapTrade
-    print_header("Processing Orders via SnapTrade API")
-    successful = 0
-    failed = 0
+    if not total:
+        logger.error("\n❌ No valid orders found in CSV file")
+        return 1
     
-    for idx, csv_order in enumerate(orders, 1):
-        print(f"\n[{idx}/{len(orders)}] Processing order from row {csv_order['row_number']}:")
-        print(f"   {csv_order['action']} {csv_order['quantity']} {csv_order['symbol']}")
-        print(f"   Type: {csv_order['order_type']} | TIF: {csv_order['time_in_force']}")
-        
-        # Place order via SnapTrade
-        if snaptrade.place_order_from_csv(account_id, csv_order):
-            successful += 1
-        else:
-            failed += 1
-        
-        # Small delay between orders
-        if idx < len(orders):
-            time.sleep(1)
+    successful = counts['successful']
+    failed = counts['failed']
     
     # Step 6: Summary
     print_header("Summary")
-    print(f"Total orders processed: {len(orders)}")
-    print(f"✅ Successful: {successful}")
-    print(f"❌ Failed: {failed}")
-    print(f"Mode: {'DRY RUN' if DRY_RUN else 'LIVE TRADING'}")
-    print(f"\n💡 Orders placed via SnapTrade API → Your connected IBKR account")
+    logger.info("Total orders processed: %d", total)
+    logger.info("✅ Successful: %d", successful)
+    if failed:
+        logger.error("❌ Failed: %d", failed)
+    else:
+        logger.info("❌ Failed: %d", failed)
+    logger.info("Mode: %s", 'DRY RUN' if DRY_RUN else 'LIVE TRADING')
+    logger.info("\n💡 Orders placed via SnapTrade API → Your connected IBKR account")
     
     return 0
 
@@ -432,10 +864,10 @@ if __name__ == "__main__":
         exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print("\n\n⚠️  Interrupted by user")
+        logger.warning("\n\n⚠️  Interrupted by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {str(e)}")
+        logger.error(f"\n❌ Unexpected error: {str(e)}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
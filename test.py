@@ -13,7 +13,8 @@ OPTIONS:
     --max-retries N     Maximum retry attempts for transient errors (default: 3)
     --rate-limit N      Max API calls per second (default: 5)
     --timeout N         Request timeout in seconds (default: 30)
-    --concurrency N     Number of parallel workers (default: 1, sequential)
+    --concurrency N     Max parallel workers, scaled adaptively (default: 1, sequential)
+    --skip-recent       Skip orders already placed by a run in the last 24 hours
 
 ENVIRONMENT VARIABLES (create .env file):
     SNAPTRADE_CLIENT_ID      - Your SnapTrade partner client ID
@@ -51,6 +52,7 @@ EXAMPLES:
 OUTPUT FILES:
     execution.log   - Detailed log of all operations
     results.csv     - Per-row results with status and broker order IDs
+    placed_orders.json - Idempotency keys of placed orders (with --skip-recent)
 
 Author: SnapTrade Integration Team
 """
@@ -58,17 +60,27 @@ Author: SnapTrade Integration Team
 import os
 import sys
 import argparse
+import atexit
 import csv
 import hashlib
+import heapq
+import itertools
+import json
+import threading
 import logging
+import operator
+import queue
+import random
 import time
-from typing import List, Dict, Optional, Set, Tuple
+from collections import Counter, deque
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
-from pprint import pprint
+from functools import cached_property
+from logging.handlers import QueueHandler, QueueListener
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -84,21 +96,63 @@ except ImportError as e:
     print("    pip install snaptrade-python-sdk python-dotenv")
     sys.exit(1)
 
+# Optional: faster JSON decoding of SDK responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: vectorized CSV parsing for large order files
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    _ARROW_ERRORS = (pa.ArrowInvalid,)
+except ImportError:
+    pa = pa_csv = None
+    _ARROW_ERRORS = ()
+
 # ═══════════════════════════════════════════════════════════════════
 # LOGGING CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
 
 LOG_FORMAT = '%(asctime)s | %(levelname)-8s | %(message)s'
-logging.basicConfig(
-    level=logging.INFO,
-    format=LOG_FORMAT,
-    handlers=[
-        logging.FileHandler('execution.log', encoding='utf-8', mode='a'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+# Worker threads only enqueue records; a single listener thread formats and
+# writes them, so API calls never wait on the log file or stdout.
+_log_formatter = logging.Formatter(LOG_FORMAT)
+_log_handlers = [
+    logging.FileHandler('execution.log', encoding='utf-8', mode='a'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# ═══════════════════════════════════════════════════════════════════
+# SDK TUNING
+# ═══════════════════════════════════════════════════════════════════
+
+def install_fast_json():
+    """Decode SnapTrade response bodies with orjson when it is installed."""
+    if orjson is None:
+        return
+    try:
+        from snaptrade_client import api_client
+    except ImportError:
+        return
+    response_cls = getattr(api_client, 'OpenApiResponse', None)
+    if response_cls is not None and hasattr(response_cls, '_OpenApiResponse__deserialize_json'):
+        response_cls._OpenApiResponse__deserialize_json = staticmethod(orjson.loads)
+
+install_fast_json()
+
 # ═══════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════
@@ -109,15 +163,31 @@ SNAPTRADE_CONSUMER_KEY = os.getenv("SNAPTRADE_CONSUMER_KEY")
 SNAPTRADE_USER_ID = os.getenv("SNAPTRADE_USER_ID")
 SNAPTRADE_USER_SECRET = os.getenv("SNAPTRADE_USER_SECRET")
 
+# Retry backoff bounds (seconds)
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+
+# pyarrow CSV read block size (bytes per streamed batch)
+CSV_BLOCK_SIZE = 8 << 20
+
+# CSV validation (tuples keep error messages in a stable order)
+_REQUIRED_HEADERS = frozenset({
+    'account_id', 'ticker', 'side', 'quantity', 'order_type',
+    'limit_price', 'stop_price', 'time_in_force', 'exchange'
+})
+_REQUIRED_FIELDS = ('ticker', 'side', 'quantity', 'order_type')
+_VALID_SIDES = frozenset({'BUY', 'SELL'})
+_ORDER_TYPES = ('MARKET', 'LIMIT', 'STOP', 'STOP_LIMIT')
+_VALID_ORDER_TYPES = frozenset(_ORDER_TYPES)
+_VALID_TIFS = frozenset({'DAY', 'GTC'})
+
 def print_header(title: str):
-    """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    """Log a formatted header."""
+    logger.info("\n" + "=" * 70 + f"\n  {title}\n" + "=" * 70)
 
 def print_section(title: str):
-    """Print a formatted section."""
-    print(f"\n--- {title} ---")
+    """Log a formatted section."""
+    logger.info(f"\n--- {title} ---")
 
 def validate_credentials():
     """Validate that all required credentials are present."""
@@ -146,7 +216,7 @@ def validate_credentials():
 # DATA MODELS
 # ═══════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True)
 class OrderRow:
     """Represents a validated order from the CSV."""
     row_num: int
@@ -160,9 +230,10 @@ class OrderRow:
     time_in_force: str
     exchange: Optional[str]
     
+    @cached_property
     def idempotency_key(self) -> str:
         """
-        Generate unique idempotency key for this order.
+        Unique idempotency key for this order, computed once per row.
         Prevents duplicate submissions within the same run.
         """
         components = [
@@ -176,10 +247,10 @@ class OrderRow:
             self.time_in_force,
         ]
         data = '|'.join(components).encode('utf-8')
-        return hashlib.sha256(data).hexdigest()[:16]
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """Result of processing a single order."""
     row_num: int
@@ -188,20 +259,236 @@ class OrderResult:
     broker_order_id: Optional[str] = None
     filled_qty: Optional[str] = None
     
-    def to_dict(self) -> dict:
-        """Convert to dict for CSV output."""
-        return {
-            'input_row': self.row_num,
-            'status': self.status,
-            'reason': self.reason,
-            'broker_order_id': self.broker_order_id or '',
-            'filled_qty': self.filled_qty or '',
+    def as_row(self) -> tuple:
+        """Convert to a CSV row, in ResultsWriter.FIELDNAMES order."""
+        return (self.row_num, self.status, self.reason,
+                self.broker_order_id or '', self.filled_qty or '')
+
+class PlacedOrderLedger:
+    """
+    Idempotency keys of orders placed by recent runs, persisted as JSON.
+    Lets a re-run of the same CSV skip orders that already went through.
+    """
+    
+    def __init__(self, path: Path, max_age_seconds: float = 24 * 3600):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self._placed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Load keys newer than max_age_seconds; a missing file is fine."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                placed = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {self.path}, starting with an empty ledger: {e}")
+            return
+        if not isinstance(placed, dict):
+            logger.warning(f"Ignoring {self.path}: expected a JSON object, got {type(placed).__name__}")
+            return
+        cutoff = time.time() - self.max_age_seconds
+        self._placed = {
+            key: ts for key, ts in placed.items()
+            if isinstance(ts, (int, float)) and ts >= cutoff
         }
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._placed
+    
+    def record(self, key: str):
+        with self._lock:
+            self._placed[key] = time.time()
+    
+    def save(self):
+        with self._lock:
+            placed = dict(self._placed)
+        # Write a sibling file and swap it in so a crash never leaves a truncated ledger
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(placed, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write {self.path}: {e}")
+
+# ═══════════════════════════════════════════════════════════════════
+# RATE LIMITING
+# ═══════════════════════════════════════════════════════════════════
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Allows bursts up to `capacity` calls and refills at `rate` tokens/sec,
+    so callers only block when the bucket is actually empty.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available and any pause has ended, then consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                    self.last_refill = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def pause(self, seconds: float):
+        """Hold every caller for `seconds`, e.g. until a quota window resets."""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+    
+    def set_rate(self, rate: float):
+        """Change the refill rate (e.g. when the server reports low quota)."""
+        with self._lock:
+            self.rate = rate
+
+class AIMDController:
+    """
+    Adaptive concurrency limit (additive increase, multiplicative decrease).
+    Grows by `alpha` after healthy calls and shrinks by `beta` on 429/5xx,
+    network errors, or when mean latency exceeds `target_latency` seconds,
+    so --concurrency acts as a ceiling rather than a fixed worker count.
+    """
+    
+    def __init__(self, max_limit: int, min_limit: int = 1, alpha: float = 0.5,
+                 beta: float = 0.5, target_latency: float = 2.0, window: int = 20):
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.alpha = alpha
+        self.beta = beta
+        self.target_latency = target_latency
+        self.limit = float(min_limit)
+        self._active = 0
+        self._latencies = deque(maxlen=window)
+        self._cond = threading.Condition()
+    
+    def __enter__(self):
+        with self._cond:
+            while self._active >= int(self.limit):
+                self._cond.wait()
+            self._active += 1
+        return self
+    
+    def __exit__(self, *exc_info):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+    
+    def record(self, latency: float, overloaded: bool):
+        """Feed back one API call's latency and whether the server pushed back."""
+        with self._cond:
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            if overloaded or mean_latency > self.target_latency:
+                self.limit = max(self.min_limit, self.limit * self.beta)
+            else:
+                self.limit = min(self.max_limit, self.limit + self.alpha)
+            self._cond.notify_all()
 
 # ═══════════════════════════════════════════════════════════════════
 # SNAPTRADE CLIENT (UPDATED)
 # ═══════════════════════════════════════════════════════════════════
 
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if present and numeric."""
+    try:
+        return max(float(headers.get('Retry-After')), 0.0)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _rate_limit_scopes(headers) -> Dict[str, Tuple[int, int, Optional[float]]]:
+    """
+    (remaining, limit, reset_seconds) for each SnapTrade rate-limit scope
+    reported in the headers, keyed 'customer' (X-RateLimit-*) or 'account'
+    (X-RateLimit-Account-*). Scopes with missing or malformed headers are omitted.
+    """
+    scopes = {}
+    if not headers:
+        return scopes
+    for scope, prefix in (('customer', 'X-RateLimit-'), ('account', 'X-RateLimit-Account-')):
+        try:
+            remaining = int(headers.get(prefix + 'Remaining'))
+            limit = int(headers.get(prefix + 'Limit'))
+        except (TypeError, ValueError):
+            continue
+        try:
+            reset = max(float(headers.get(prefix + 'Reset')), 0.0)
+        except (TypeError, ValueError):
+            reset = None
+        scopes[scope] = (remaining, limit, reset)
+    return scopes
+
+
+def _backoff_delay(previous: float) -> float:
+    """Next retry delay using decorrelated jitter, so workers don't retry in lockstep."""
+    return min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, previous * 3))
+
+
+def _exchange_code(symbol: dict) -> str:
+    """Exchange code of a SnapTrade symbol payload, or '' if absent."""
+    return (symbol.get('exchange') or {}).get('code') or ''
+
+
+# Impact-check parameters per order type. validate_order_row guarantees the
+# prices each type needs are present and positive.
+def _market_order_params(order: OrderRow, symbol_id: str) -> dict:
+    return {
+        'account_id': order.account_id,
+        'action': order.side,
+        'order_type': order.order_type,
+        'quantity': float(order.quantity),
+        'universal_symbol_id': symbol_id,
+        'time_in_force': order.time_in_force,
+    }
+
+
+def _limit_order_params(order: OrderRow, symbol_id: str) -> dict:
+    params = _market_order_params(order, symbol_id)
+    params['price'] = float(order.limit_price)
+    return params
+
+
+def _stop_order_params(order: OrderRow, symbol_id: str) -> dict:
+    params = _market_order_params(order, symbol_id)
+    params['stop'] = float(order.stop_price)
+    return params
+
+
+def _stop_limit_order_params(order: OrderRow, symbol_id: str) -> dict:
+    params = _limit_order_params(order, symbol_id)
+    params['stop'] = float(order.stop_price)
+    return params
+
+
+_ORDER_PARAM_BUILDERS = {
+    'MARKET': _market_order_params,
+    'LIMIT': _limit_order_params,
+    'STOP': _stop_order_params,
+    'STOP_LIMIT': _stop_limit_order_params,
+}
+
+
 class SnapTradeManager:
     """
     Manages SnapTrade API interactions.
@@ -215,7 +502,8 @@ class SnapTradeManager:
     - Removed order fetching (now CSV-based)
     """
     
-    def __init__(self, rate_limit: int = 5, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, rate_limit: int = 5, timeout: int = 30, max_retries: int = 3,
+                 pool_size: int = 4):
         """Initialize SnapTrade client."""
         self.client = SnapTrade(
             consumer_key=SNAPTRADE_CONSUMER_KEY,
@@ -226,33 +514,164 @@ class SnapTradeManager:
         self.rate_limit = rate_limit
         self.timeout = timeout
         self.max_retries = max_retries
-        self._last_request_time = 0
+        self.rate_limiter = TokenBucket(rate_limit)
+        self._account_limiters: Dict[str, TokenBucket] = {}
+        self._account_limiters_lock = threading.Lock()
+        self.concurrency = AIMDController(max_limit=pool_size)
+        self._symbol_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._symbol_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._symbol_cache_lock = threading.Lock()
+        self._configure_connection_pool(pool_size)
+    
+    def _configure_connection_pool(self, pool_size: int):
+        """
+        Size the SDK's shared urllib3 pool for the worker count so every call
+        reuses a keep-alive connection instead of a fresh TCP+TLS handshake,
+        and apply --timeout to every request.
+        urllib3's own retries are disabled so --timeout bounds each attempt;
+        _call_with_retry does the retrying.
+        """
+        rest_client = getattr(self.client.api_status.api_client, 'rest_client', None)
+        pool_manager = getattr(rest_client, 'pool_manager', None)
+        if pool_manager is None:
+            return
+        
+        pool_manager.connection_pool_kw.update(
+            maxsize=max(pool_size, 1),
+            block=True,
+            retries=False,
+        )
+        pool_manager.clear()  # Drop pools created with the old settings
+        
+        # The SDK passes timeout=None on every request, which overrides any
+        # pool default, so supply the timeout per call instead
+        send = getattr(rest_client, 'request', None)
+        if send is None:
+            return
+        
+        def request_with_timeout(*args, timeout=None, **kwargs):
+            return send(*args, timeout=timeout or self.timeout, **kwargs)
+        
+        rest_client.request = request_with_timeout
+    
+    def close(self):
+        """Close the pooled keep-alive connections."""
+        rest_client = getattr(self.client.api_status.api_client, 'rest_client', None)
+        pool_manager = getattr(rest_client, 'pool_manager', None)
+        if pool_manager is not None:
+            pool_manager.clear()
+    
+    def warm_connections(self, count: int):
+        """
+        Open `count` pooled connections up front with concurrent status checks,
+        so the first burst of worker requests doesn't pay for TLS handshakes.
+        """
+        if count <= 1:
+            return  # test_connection already warmed one socket
+        
+        def _ping(_):
+            self._apply_rate_limit()
+            try:
+                self.client.api_status.check()
+            except Exception:
+                pass  # Best effort; real requests will report errors
+        
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            list(executor.map(_ping, range(count)))
     
     def _apply_rate_limit(self):
-        """Simple rate limiting - ensure minimum gap between requests."""
-        if self.rate_limit > 0:
-            min_gap = 1.0 / self.rate_limit
-            elapsed = time.time() - self._last_request_time
-            if elapsed < min_gap:
-                time.sleep(min_gap - elapsed)
-        self._last_request_time = time.time()
-    
-    def _call_with_retry(self, func, *args, **kwargs):
+        """Wait for a rate-limit token (shared by all worker threads)."""
+        self.rate_limiter.acquire()
+    
+    def _account_limiter(self, account_id: str) -> TokenBucket:
+        """
+        Token bucket for one account's X-RateLimit-Account-* quota, so an
+        account that runs low only slows its own orders.
+        """
+        with self._account_limiters_lock:
+            limiter = self._account_limiters.get(account_id)
+            if limiter is None:
+                limiter = self._account_limiters[account_id] = TokenBucket(self.rate_limit)
+            return limiter
+    
+    def _update_rate_from_headers(self, headers, account_limiter: Optional[TokenBucket] = None,
+                                  recover: bool = True):
+        """
+        Slow down before the server starts returning 429s. Customer-level
+        headers pace the shared limiter; account-level headers pace only the
+        calling account's limiter.
+        """
+        scopes = _rate_limit_scopes(headers)
+        self._pace_limiter(self.rate_limiter, scopes.get('customer'), "Customer", recover)
+        if account_limiter is not None:
+            self._pace_limiter(account_limiter, scopes.get('account'), "Account", recover)
+    
+    def _pace_limiter(self, limiter: TokenBucket, scope: Optional[Tuple[int, int, Optional[float]]],
+                      label: str, recover: bool):
+        """
+        Adjust one limiter from its scope's (remaining, limit, reset). An
+        exhausted quota pauses the limiter until its window resets. Otherwise
+        the rate is capped at what is left of the quota spread over the time
+        until reset; when no reset is reported, it halves under 10% remaining
+        and holds under 50%. With plenty of quota, or no headers at all, it
+        doubles back toward --rate-limit, which it never exceeds.
+        """
+        if self.rate_limit <= 0:
+            return
+        
+        current = limiter.rate
+        target = min(self.rate_limit, current * 2) if recover else current
+        if scope is not None and scope[1] > 0:
+            remaining, limit, reset = scope
+            if remaining <= 0 and reset:
+                logger.warning("%s rate limit quota exhausted (0/%d); pausing %.1fs until it resets",
+                               label, limit, reset)
+                limiter.pause(reset)
+                return
+            if reset:
+                target = min(self.rate_limit, remaining / reset)
+            elif remaining < limit * 0.1:
+                # No reset reported: back off, assuming a minute-long window
+                target = min(current, max(current / 2, limit / 60))
+            elif remaining < limit * 0.5:
+                target = current
+        
+        if target < current:
+            logger.warning("%s rate limit quota low; slowing to %.2f req/s", label, target)
+        if target != current:
+            limiter.set_rate(target)
+    
+    def _call_with_retry(self, func, *args, rate_account: Optional[str] = None, **kwargs):
         """
-        Call a SnapTrade API function with exponential backoff retry.
+        Call a SnapTrade API function with jittered exponential backoff retry.
         Retries on: network errors, rate limits, server errors
         Does NOT retry on: 4xx client errors
+        Calls made for an account (its account_id kwarg, or rate_account when
+        the endpoint doesn't take one) also wait on that account's limiter.
         """
         last_exception = None
+        wait = RETRY_BASE_DELAY
+        account_id = rate_account or kwargs.get('account_id')
+        account_limiter = self._account_limiter(account_id) if account_id else None
         
         for attempt in range(self.max_retries + 1):
+            if account_limiter is not None:
+                account_limiter.acquire()
+            self._apply_rate_limit()
+            started = time.monotonic()
             try:
-                self._apply_rate_limit()
                 result = func(*args, **kwargs)
+                self.concurrency.record(time.monotonic() - started, overloaded=False)
+                self._update_rate_from_headers(getattr(result, 'headers', None), account_limiter)
                 return result
                 
             except ApiException as e:
                 last_exception = e
+                status = getattr(e, 'status', None) or 0
+                self.concurrency.record(time.monotonic() - started,
+                                        overloaded=status == 429 or status >= 500)
+                self._update_rate_from_headers(getattr(e, 'headers', None), account_limiter,
+                                               recover=status != 429)
                 
                 # Don't retry on 4xx client errors (except 429)
                 if hasattr(e, 'status'):
@@ -260,25 +679,34 @@ class SnapTradeManager:
                         logger.error(f"Client error {e.status}: {e}")
                         raise
                     
-                    # Retry on rate limiting
-                    if e.status == 429:
-                        wait = 2 ** attempt
-                        logger.warning(f"Rate limited (429). Waiting {wait}s before retry...")
+                    # Retry on rate limiting: wait for the server's stated
+                    # Retry-After or the exhausted scope's reset, so the
+                    # retries aren't spent inside the same quota window.
+                    # Exhausted scopes were paused above; if none was named,
+                    # pause the limiter this call was made under.
+                    if e.status == 429 and attempt < self.max_retries:
+                        resets = [reset for remaining, _, reset in _rate_limit_scopes(e.headers).values()
+                                  if remaining <= 0 and reset]
+                        wait = (_retry_after_seconds(e.headers) or (max(resets) if resets else None)
+                                or _backoff_delay(wait))
+                        logger.warning(f"Rate limited (429). Waiting {wait:.1f}s before retry...")
+                        if not resets:
+                            (account_limiter or self.rate_limiter).pause(wait)
                         time.sleep(wait)
                         continue
                     
                     # Retry on server errors
                     if 500 <= e.status < 600:
                         if attempt < self.max_retries:
-                            wait = 2 ** attempt
-                            logger.warning(f"Server error {e.status}. Retrying in {wait}s... (attempt {attempt + 1}/{self.max_retries})")
+                            wait = _backoff_delay(wait)
+                            logger.warning(f"Server error {e.status}. Retrying in {wait:.1f}s... (attempt {attempt + 1}/{self.max_retries})")
                             time.sleep(wait)
                             continue
                 
                 # Generic retry for other ApiExceptions
                 if attempt < self.max_retries:
-                    wait = 2 ** attempt
-                    logger.warning(f"API error: {e}. Retrying in {wait}s... (attempt {attempt + 1}/{self.max_retries})")
+                    wait = _backoff_delay(wait)
+                    logger.warning(f"API error: {e}. Retrying in {wait:.1f}s... (attempt {attempt + 1}/{self.max_retries})")
                     time.sleep(wait)
                 else:
                     logger.error(f"API call failed after {self.max_retries + 1} attempts: {e}")
@@ -286,9 +714,10 @@ class SnapTradeManager:
                     
             except Exception as e:
                 last_exception = e
+                self.concurrency.record(time.monotonic() - started, overloaded=True)
                 if attempt < self.max_retries:
-                    wait = 2 ** attempt
-                    logger.warning(f"Request failed: {e}. Retrying in {wait}s... (attempt {attempt + 1}/{self.max_retries})")
+                    wait = _backoff_delay(wait)
+                    logger.warning(f"Request failed: {e}. Retrying in {wait:.1f}s... (attempt {attempt + 1}/{self.max_retries})")
                     time.sleep(wait)
                 else:
                     logger.error(f"Request failed after {self.max_retries + 1} attempts: {e}")
@@ -312,52 +741,69 @@ class SnapTradeManager:
         """
         Search for symbols matching ticker.
         If exchange is provided, filters to that exchange.
+        Raises on API errors so callers can tell them apart from "not found".
         
         NEW METHOD - Added for CSV symbol resolution
         """
-        try:
-            # SnapTrade symbol search
-            response = self._call_with_retry(
-                self.client.trading.get_user_account_quotes,
-                user_id=self.user_id,
-                user_secret=self.user_secret,
-                symbols=ticker,
-                use_ticker=True
-            )
-            
-            # Parse response
-            if hasattr(response, 'body'):
-                symbols = response.body if isinstance(response.body, list) else [response.body]
-            else:
-                symbols = []
-            
-            # Filter by exchange if specified
-            if exchange and symbols:
-                exchange_upper = exchange.upper()
-                symbols = [
-                    s for s in symbols
-                    if s.get('exchange', {}).get('code', '').upper() == exchange_upper
-                ]
-            
-            # Prefer exact ticker matches
-            if symbols:
-                exact_matches = [
-                    s for s in symbols
-                    if s.get('symbol', '').upper() == ticker.upper()
-                ]
-                if exact_matches:
-                    return exact_matches
-            
-            return symbols
-            
-        except Exception as e:
-            logger.error(f"Symbol search failed for '{ticker}': {e}")
-            return []
+        # SnapTrade symbol search
+        response = self._call_with_retry(
+            self.client.trading.get_user_account_quotes,
+            user_id=self.user_id,
+            user_secret=self.user_secret,
+            symbols=ticker,
+            use_ticker=True
+        )
+        
+        # Parse response
+        if hasattr(response, 'body'):
+            symbols = response.body if isinstance(response.body, list) else [response.body]
+        else:
+            symbols = []
+        
+        # Filter by exchange if specified, preferring exact ticker matches.
+        # ticker and exchange arrive upper-cased from validate_order_row.
+        matches = []
+        exact_matches = []
+        for sym in symbols:
+            if exchange and _exchange_code(sym).upper() != exchange:
+                continue
+            matches.append(sym)
+            if (sym.get('symbol') or '').upper() == ticker:
+                exact_matches.append(sym)
+        
+        return exact_matches or matches
     
     def get_universal_symbol_id(self, ticker: str, exchange: Optional[str] = None) -> Optional[str]:
         """
         Resolve ticker to universal_symbol_id.
         Returns None if symbol not found or ambiguous.
+        Results (including "not found") are cached for the run; concurrent
+        lookups of the same ticker/exchange share a single API call.
+        """
+        key = (ticker, exchange or '')
+        with self._symbol_cache_lock:
+            if key in self._symbol_cache:
+                return self._symbol_cache[key]
+            key_lock = self._symbol_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            if key in self._symbol_cache:
+                return self._symbol_cache[key]
+            
+            try:
+                symbol_id = self._resolve_universal_symbol_id(ticker, exchange)
+            except Exception as e:
+                # Transient failures are not cached so a later order can retry
+                logger.error(f"Symbol search failed for '{ticker}': {e}")
+                return None
+            
+            with self._symbol_cache_lock:
+                self._symbol_cache[key] = symbol_id
+            return symbol_id
+    
+    def _resolve_universal_symbol_id(self, ticker: str, exchange: Optional[str]) -> Optional[str]:
+        """
+        Uncached resolution behind get_universal_symbol_id.
         
         NEW METHOD - Added for CSV symbol resolution
         """
@@ -370,7 +816,7 @@ class SnapTradeManager:
         if len(symbols) > 1:
             logger.warning(f"Multiple symbols found for '{ticker}':")
             for sym in symbols[:5]:  # Show first 5
-                exch = sym.get('exchange', {}).get('code', 'UNKNOWN')
+                exch = _exchange_code(sym) or 'UNKNOWN'
                 logger.warning(f"  - {sym.get('symbol')} on {exch}")
             
             if not exchange:
@@ -379,11 +825,12 @@ class SnapTradeManager:
             
             logger.warning(f"Multiple listings on {exchange}. Using first match.")
         
-        symbol_id = symbols[0].get('id') or symbols[0].get('universal_symbol_id')
-        symbol_name = symbols[0].get('symbol', ticker)
-        exch_code = symbols[0].get('exchange', {}).get('code', '')
+        best = symbols[0]
+        symbol_id = best.get('id') or best.get('universal_symbol_id')
+        symbol_name = best.get('symbol', ticker)
+        exch_code = _exchange_code(best)
         
-        logger.info(f"✓ Resolved '{ticker}' → {symbol_name} ({exch_code}) [id={symbol_id}]")
+        logger.info("✓ Resolved '%s' → %s (%s) [id=%s]", ticker, symbol_name, exch_code, symbol_id)
         return symbol_id
     
     def check_order_impact(self, order: OrderRow, symbol_id: str) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -394,24 +841,8 @@ class SnapTradeManager:
         NEW METHOD - Two-step order flow (step 1)
         """
         try:
-            # Build order parameters
-            order_params = {
-                'account_id': order.account_id,
-                'action': order.side,
-                'order_type': order.order_type,
-                'quantity': float(order.quantity),
-                'universal_symbol_id': symbol_id,
-                'time_in_force': order.time_in_force,
-            }
-            
-            # Add price fields based on order type
-            if order.order_type in ('LIMIT', 'STOP_LIMIT'):
-                if order.limit_price:
-                    order_params['price'] = float(order.limit_price)
-            
-            if order.order_type in ('STOP', 'STOP_LIMIT'):
-                if order.stop_price:
-                    order_params['stop'] = float(order.stop_price)
+            # Build order parameters (price fields depend on order type)
+            order_params = _ORDER_PARAM_BUILDERS[order.order_type](order, symbol_id)
             
             # Call impact check API
             response = self._call_with_retry(
@@ -433,7 +864,7 @@ class SnapTradeManager:
                 logger.error(f"Impact check response missing trade_id: {data}")
                 return False, None, "No trade_id in impact check response"
             
-            logger.info(f"✓ Impact check passed [trade_id={trade_id}]")
+            logger.info("✓ Impact check passed [trade_id=%s]", trade_id)
             return True, trade_id, None
             
         except ApiException as e:
@@ -445,7 +876,7 @@ class SnapTradeManager:
             logger.error(f"Impact check error: {e}")
             return False, None, f"Impact check error: {str(e)}"
     
-    def place_order(self, trade_id: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    def place_order(self, trade_id: str, account_id: Optional[str] = None) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Place order using trade_id from impact check.
         Returns: (success, broker_order_id, error_message)
@@ -458,7 +889,8 @@ class SnapTradeManager:
                 self.client.trading.place_order,
                 trade_id=trade_id,
                 user_id=self.user_id,
-                user_secret=self.user_secret
+                user_secret=self.user_secret,
+                rate_account=account_id
             )
             
             # Extract order ID from response
@@ -478,7 +910,7 @@ class SnapTradeManager:
                 logger.warning(f"Order placed but no order_id in response: {data}")
                 order_id = trade_id  # Fallback to trade_id
             
-            logger.info(f"✓ Order placed [broker_order_id={order_id}]")
+            logger.info("✓ Order placed [broker_order_id=%s]", order_id)
             return True, order_id, None
             
         except ApiException as e:
@@ -503,21 +935,22 @@ class SnapTradeManager:
                 user_id=self.user_id,
                 user_secret=self.user_secret
             )
-            logger.debug(f"Triggered account refresh for {account_id}")
+            logger.debug("Triggered account refresh for %s", account_id)
         except Exception as e:
-            logger.debug(f"Account refresh failed (non-critical): {e}")
+            logger.debug("Account refresh failed (non-critical): %s", e)
 
 # ═══════════════════════════════════════════════════════════════════
 # CSV PARSING & VALIDATION (NEW SECTION)
 # ═══════════════════════════════════════════════════════════════════
 
-def parse_decimal(value: str, field_name: str) -> Optional[Decimal]:
+def parse_decimal(value: Optional[str], field_name: str) -> Optional[Decimal]:
     """Parse string to Decimal, handling empty/whitespace values."""
-    if not value or not value.strip():
+    value = value.strip() if value else ''
+    if not value:
         return None
     
     try:
-        return Decimal(value.strip())
+        return Decimal(value)
     except (InvalidOperation, ValueError):
         logger.warning(f"Invalid decimal for {field_name}: '{value}'")
         return None
@@ -530,25 +963,20 @@ def validate_order_row(row_dict: dict, row_num: int) -> Tuple[Optional[OrderRow]
     
     NEW FUNCTION - CSV validation logic
     """
-    # Trim all string values
-    row_dict = {k: v.strip() if isinstance(v, str) else v for k, v in row_dict.items()}
-    
-    # Required fields check
-    required = ['ticker', 'side', 'quantity', 'order_type']
-    missing = [f for f in required if not row_dict.get(f)]
+    # Values are stripped where they are used (parse_decimal strips its own)
+    missing = [f for f in _REQUIRED_FIELDS if not (row_dict.get(f) or '').strip()]
     if missing:
         return None, f"Missing required fields: {', '.join(missing)}"
     
     # Validate SIDE
-    side = row_dict['side'].upper()
-    if side not in ('BUY', 'SELL'):
+    side = row_dict['side'].strip().upper()
+    if side not in _VALID_SIDES:
         return None, f"Invalid side '{side}'. Must be BUY or SELL"
     
     # Validate ORDER_TYPE
-    order_type = row_dict['order_type'].upper()
-    valid_types = ('MARKET', 'LIMIT', 'STOP', 'STOP_LIMIT')
-    if order_type not in valid_types:
-        return None, f"Invalid order_type '{order_type}'. Must be one of: {', '.join(valid_types)}"
+    order_type = row_dict['order_type'].strip().upper()
+    if order_type not in _VALID_ORDER_TYPES:
+        return None, f"Invalid order_type '{order_type}'. Must be one of: {', '.join(_ORDER_TYPES)}"
     
     # Parse QUANTITY
     quantity = parse_decimal(row_dict['quantity'], 'quantity')
@@ -558,8 +986,8 @@ def validate_order_row(row_dict: dict, row_num: int) -> Tuple[Optional[OrderRow]
         return None, f"Quantity must be positive, got {quantity}"
     
     # Parse prices
-    limit_price = parse_decimal(row_dict.get('limit_price', ''), 'limit_price')
-    stop_price = parse_decimal(row_dict.get('stop_price', ''), 'stop_price')
+    limit_price = parse_decimal(row_dict.get('limit_price'), 'limit_price')
+    stop_price = parse_decimal(row_dict.get('stop_price'), 'stop_price')
     
     # Validate price requirements by order type
     if order_type == 'LIMIT':
@@ -577,35 +1005,76 @@ def validate_order_row(row_dict: dict, row_num: int) -> Tuple[Optional[OrderRow]
             return None, "STOP_LIMIT order requires a valid stop_price > 0"
     
     # TIME_IN_FORCE - default to DAY if blank
-    tif = row_dict.get('time_in_force', '').upper() or 'DAY'
-    if tif not in ('DAY', 'GTC'):
+    tif = (row_dict.get('time_in_force') or '').strip().upper() or 'DAY'
+    if tif not in _VALID_TIFS:
         return None, f"Invalid time_in_force '{tif}'. Must be DAY or GTC"
     
     # Optional fields
-    account_id = row_dict.get('account_id', '').strip()
-    exchange = row_dict.get('exchange', '').strip() or None
+    account_id = (row_dict.get('account_id') or '').strip()
+    exchange = (row_dict.get('exchange') or '').strip().upper() or None
     
-    # Create validated OrderRow
+    # Create validated OrderRow. Low-cardinality fields are interned so
+    # rows share one string object per distinct value.
     order = OrderRow(
         row_num=row_num,
-        account_id=account_id,
-        ticker=row_dict['ticker'].upper(),
-        side=side,
+        account_id=sys.intern(account_id),
+        ticker=sys.intern(row_dict['ticker'].strip().upper()),
+        side=sys.intern(side),
         quantity=quantity,
-        order_type=order_type,
+        order_type=sys.intern(order_type),
         limit_price=limit_price,
         stop_price=stop_price,
-        time_in_force=tif,
-        exchange=exchange,
+        time_in_force=sys.intern(tif),
+        exchange=sys.intern(exchange) if exchange else None,
     )
     
     return order, None
 
 
-def load_orders_from_csv(csv_path: Path) -> List[Tuple[int, dict]]:
+class CsvReadError(Exception):
+    """The orders CSV became unreadable after some rows were already handed out."""
+
+
+def _iter_rows_with_pyarrow(csv_path: Path, fieldnames: List[str]) -> Iterator[dict]:
+    """
+    Stream rows with pyarrow's C++ CSV reader one block at a time, keeping
+    every column as a string (prices stay exact for Decimal). Raises
+    pa.ArrowInvalid if the file turns out to be malformed part-way through.
     """
-    Load orders from CSV file.
-    Returns list of (row_number, row_dict) tuples.
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in fieldnames},
+        ),
+    )
+    for batch in reader:
+        yield from batch.to_pylist()
+
+
+def _iter_rows_with_csv(reader, header: List[str]) -> Iterator[dict]:
+    """
+    Rows from a csv.reader as dicts of the required columns, picked by
+    position. Blank lines are skipped and short rows padded, as DictReader
+    would.
+    """
+    names = sorted(_REQUIRED_HEADERS)
+    pick = operator.itemgetter(*(header.index(name) for name in names))
+    width = len(header)
+    for raw in reader:
+        if not raw:
+            continue
+        if len(raw) < width:
+            raw += [''] * (width - len(raw))
+        yield dict(zip(names, pick(raw)))
+
+
+def iter_orders_from_csv(csv_path: Path) -> Iterator[Tuple[int, dict]]:
+    """
+    Stream orders from CSV file without loading it all into memory.
+    Yields (row_number, row_dict) tuples; headers are checked on first use.
+    Problems found before the first row is yielded exit the script; later
+    read errors raise CsvReadError, since orders may already be in flight.
     
     NEW FUNCTION - CSV loading with validation
     """
@@ -613,50 +1082,63 @@ def load_orders_from_csv(csv_path: Path) -> List[Tuple[int, dict]]:
         logger.error(f"CSV file not found: {csv_path}")
         sys.exit(1)
     
-    orders = []
+    loaded = 0
+    row_num = 1  # Row 1 is header
     
     try:
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            # Validate required headers are present
-            required_headers = {
-                'account_id', 'ticker', 'side', 'quantity', 'order_type',
-                'limit_price', 'stop_price', 'time_in_force', 'exchange'
-            }
+            reader = csv.reader(f)
+            header = next(reader, None)
             
-            if not reader.fieldnames:
+            if not header:
                 logger.error("CSV file is empty or has no headers")
                 sys.exit(1)
             
-            actual_headers = set(reader.fieldnames)
-            missing = required_headers - actual_headers
+            # Validate required headers are present
+            missing = _REQUIRED_HEADERS.difference(header)
             
             if missing:
                 logger.error(f"CSV missing required headers: {', '.join(sorted(missing))}")
-                logger.error(f"Expected headers: {', '.join(sorted(required_headers))}")
-                logger.error(f"Found headers: {', '.join(sorted(actual_headers))}")
+                logger.error(f"Expected headers: {', '.join(sorted(_REQUIRED_HEADERS))}")
+                logger.error(f"Found headers: {', '.join(sorted(set(header)))}")
                 sys.exit(1)
             
-            # Read rows
-            for row_num, row in enumerate(reader, start=2):  # Row 1 is header
-                # Skip completely blank rows
-                if not any(row.values()):
-                    logger.debug(f"Row {row_num}: Skipping blank row")
-                    continue
-                
-                # Skip comment rows (ticker starts with #)
-                ticker = row.get('ticker', '').strip()
-                if ticker.startswith('#'):
-                    logger.info(f"Row {row_num}: Skipping comment row")
-                    continue
-                
-                orders.append((row_num, row))
+            # Read rows (pyarrow when available, otherwise the csv reader above)
+            csv_rows = _iter_rows_with_csv(reader, header)
+            rows = csv_rows
+            if pa_csv is not None:
+                rows = _iter_rows_with_pyarrow(csv_path, header)
+            
+            while True:
+                try:
+                    for row in rows:
+                        row_num += 1
+                        
+                        # Skip completely blank rows
+                        if not any(row.values()):
+                            logger.debug("Row %d: Skipping blank row", row_num)
+                            continue
+                        
+                        # Skip comment rows (ticker starts with #)
+                        ticker = row.get('ticker', '').strip()
+                        if ticker.startswith('#'):
+                            logger.info("Row %d: Skipping comment row", row_num)
+                            continue
+                        
+                        loaded += 1
+                        yield row_num, row
+                    break
+                except _ARROW_ERRORS as e:
+                    # pyarrow rejected the file; resume with the csv module
+                    # after the rows already handed out
+                    logger.debug("pyarrow could not parse %s (%s); using csv module", csv_path, e)
+                    rows = itertools.islice(csv_rows, row_num - 1, None)
         
-        logger.info(f"✓ Loaded {len(orders)} order rows from {csv_path}")
-        return orders
+        logger.info("✓ Loaded %d order rows from %s", loaded, csv_path)
         
     except Exception as e:
+        if loaded:
+            raise CsvReadError(f"Failed to read CSV file after row {row_num}: {e}") from e
         logger.error(f"Failed to read CSV file: {e}")
         sys.exit(1)
 
@@ -668,7 +1150,7 @@ def process_single_order(
     order: OrderRow,
     snaptrade: SnapTradeManager,
     dry_run: bool,
-    seen_keys: Set[str]
+    ledger: Optional[PlacedOrderLedger] = None
 ) -> OrderResult:
     """
     Process a single validated order.
@@ -677,19 +1159,18 @@ def process_single_order(
     NEW FUNCTION - Core order processing logic
     """
     
-    logger.info(f"Row {order.row_num}: {order.side} {order.quantity} {order.ticker} @ {order.order_type}")
+    logger.info("Row %d: %s %s %s @ %s", order.row_num, order.side, order.quantity, order.ticker, order.order_type)
     
-    # Check idempotency
-    idem_key = order.idempotency_key()
-    if idem_key in seen_keys:
-        msg = "Duplicate order detected (same parameters already processed in this run)"
-        logger.warning(f"Row {order.row_num}: {msg}")
+    # Duplicates within this run are filtered by process_orders
+    idem_key = order.idempotency_key
+    if ledger is not None and idem_key in ledger:
+        msg = "Already placed by a run in the last 24 hours"
+        logger.warning("Row %d: %s", order.row_num, msg)
         return OrderResult(
             row_num=order.row_num,
             status='SKIPPED',
             reason=msg
         )
-    seen_keys.add(idem_key)
     
     # Step 1: Resolve ticker to universal_symbol_id
     symbol_id = snaptrade.get_universal_symbol_id(order.ticker, order.exchange)
@@ -711,7 +1192,7 @@ def process_single_order(
     
     # If dry-run, stop here
     if dry_run:
-        logger.info(f"Row {order.row_num}: [DRY-RUN] Impact check passed, would place with trade_id={trade_id}")
+        logger.info("Row %d: [DRY-RUN] Impact check passed, would place with trade_id=%s", order.row_num, trade_id)
         return OrderResult(
             row_num=order.row_num,
             status='VALIDATED',
@@ -719,7 +1200,7 @@ def process_single_order(
         )
     
     # Step 3: Place the order
-    success, broker_order_id, error = snaptrade.place_order(trade_id)
+    success, broker_order_id, error = snaptrade.place_order(trade_id, order.account_id)
     if not success:
         return OrderResult(
             row_num=order.row_num,
@@ -727,11 +1208,14 @@ def process_single_order(
             reason=f"Order placement failed: {error}"
         )
     
+    if ledger is not None:
+        ledger.record(idem_key)
+    
     # Step 4: Trigger account refresh (best effort, non-blocking)
     if order.account_id:
         snaptrade.refresh_account(order.account_id)
     
-    logger.info(f"Row {order.row_num}: ✓ PLACED successfully [order_id={broker_order_id}]")
+    logger.info("Row %d: ✓ PLACED successfully [order_id=%s]", order.row_num, broker_order_id)
     
     return OrderResult(
         row_num=order.row_num,
@@ -741,80 +1225,179 @@ def process_single_order(
     )
 
 
+def _process_with_limit(order: OrderRow, snaptrade: SnapTradeManager, *args) -> OrderResult:
+    """Run process_single_order inside the client's adaptive concurrency limit."""
+    with snaptrade.concurrency:
+        return process_single_order(order, snaptrade, *args)
+
+
 def process_orders(
-    orders: List[Tuple[int, dict]],
+    orders: Iterable[Tuple[int, dict]],
     snaptrade: SnapTradeManager,
     dry_run: bool,
-    concurrency: int
+    concurrency: int,
+    ledger: Optional[PlacedOrderLedger] = None,
+    on_result: Optional[Callable[[OrderResult], None]] = None
 ) -> List[OrderResult]:
     """
     Process all orders with optional parallel execution.
+    on_result, if given, is called with each result in input-row order, as
+    soon as every earlier row has finished; only results that complete ahead
+    of an earlier row are held back.
     
     NEW FUNCTION - Batch order processing
     """
     
     results = []
-    seen_keys: Set[str] = set()  # Idempotency tracking
-    
-    # First pass: validate all rows
-    validated_orders = []
-    for row_num, row_dict in orders:
-        order, error = validate_order_row(row_dict, row_num)
+    first_rows: Dict[str, int] = {}  # Idempotency key -> first row carrying it
+    first_statuses: Dict[int, Optional[str]] = {}  # First row -> its final status
+    waiting_duplicates: Dict[int, List[int]] = {}  # First row -> duplicate rows
+    validated_count = 0
+    
+    # Rows still owed to on_result, in input order, and finished results
+    # waiting on an earlier row (min-heap by row number)
+    unreported_rows: deque = deque()
+    finished: List[Tuple[int, OrderResult]] = []
+    
+    def record(result: OrderResult):
+        results.append(result)
+        if result.row_num in first_statuses:
+            first_statuses[result.row_num] = result.status
+            for row_num in waiting_duplicates.pop(result.row_num, ()):
+                record_duplicate(row_num, result.row_num)
         
-        if error:
-            logger.warning(f"Row {row_num}: Validation failed - {error}")
-            results.append(OrderResult(
-                row_num=row_num,
-                status='SKIPPED',
-                reason=f"Validation error: {error}"
-            ))
-        else:
-            validated_orders.append(order)
-    
-    if not validated_orders:
-        logger.warning("No valid orders to process after validation")
-        return results
-    
-    logger.info(f"Processing {len(validated_orders)} validated orders...")
+        if on_result is None:
+            return
+        if not finished and result.row_num == unreported_rows[0]:
+            # Already in order (always the case when sequential): skip the heap
+            unreported_rows.popleft()
+            on_result(result)
+            return
+        heapq.heappush(finished, (result.row_num, result))
+        while finished and finished[0][0] == unreported_rows[0]:
+            unreported_rows.popleft()
+            on_result(heapq.heappop(finished)[1])
+    
+    def record_duplicate(row_num: int, first_row: int):
+        # Duplicates report how the order they repeat actually turned out
+        record(OrderResult(
+            row_num=row_num,
+            status='SKIPPED',
+            reason=f"Duplicate order detected (same parameters as row {first_row}, which was {first_statuses[first_row]})"
+        ))
+    
+    def validated_orders() -> Iterator[OrderRow]:
+        """Validate rows as they stream in, so execution starts immediately."""
+        nonlocal validated_count
+        for row_num, row_dict in orders:
+            unreported_rows.append(row_num)
+            order, error = validate_order_row(row_dict, row_num)
+            
+            if error:
+                logger.warning("Row %d: Validation failed - %s", row_num, error)
+                record(OrderResult(
+                    row_num=row_num,
+                    status='SKIPPED',
+                    reason=f"Validation error: {error}"
+                ))
+                continue
+            
+            validated_count += 1
+            # Checked here, on the submitting thread, so workers never race on it
+            first_row = first_rows.setdefault(order.idempotency_key, row_num)
+            if first_row != row_num:
+                logger.warning("Row %d: Duplicate of row %d, skipping", row_num, first_row)
+                if first_statuses.get(first_row) is not None:
+                    record_duplicate(row_num, first_row)
+                else:
+                    waiting_duplicates.setdefault(first_row, []).append(row_num)
+                continue
+            first_statuses[row_num] = None
+            yield order
     
-    # Second pass: execute orders
+    # Execute orders while the rest of the file is still being read
     if concurrency > 1:
         # Parallel execution
-        logger.info(f"Using {concurrency} parallel workers")
+        logger.info("Using up to %d parallel workers (adaptive)", concurrency)
+        
+        def collect(future, order: OrderRow):
+            try:
+                result = future.result()
+                record(result)
+            except Exception as e:
+                logger.exception("Row %d: Unexpected error: %s", order.row_num, e)
+                record(OrderResult(
+                    row_num=order.row_num,
+                    status='FAILED',
+                    reason=f"Unexpected error: {str(e)[:200]}"
+                ))
         
+        # Cap queued work so large files don't turn into one future per row
+        max_pending = concurrency * 2
+        pending = {}
         with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            future_to_order = {
-                executor.submit(process_single_order, order, snaptrade, dry_run, seen_keys): order
-                for order in validated_orders
-            }
-            
-            for future in as_completed(future_to_order):
-                order = future_to_order[future]
+            try:
+                for order in validated_orders():
+                    if len(pending) >= max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future, pending.pop(future))
+                    pending[executor.submit(_process_with_limit, order, snaptrade, dry_run, ledger)] = order
+                
+                for future in as_completed(list(pending)):
+                    collect(future, pending.pop(future))
+            except KeyboardInterrupt:
+                # Orders already at the broker may have been placed, so let them
+                # finish and record them; drop the ones still queued
+                logger.warning("Interrupted: cancelling queued orders, waiting for in-flight ones...")
+                executor.shutdown(wait=True, cancel_futures=True)
+                for future, order in pending.items():
+                    if future.cancelled():
+                        record(OrderResult(
+                            row_num=order.row_num,
+                            status='SKIPPED',
+                            reason="Not submitted: run interrupted"
+                        ))
+                    else:
+                        collect(future, order)
+                logger.warning("Interrupted after %d row(s); rows not yet read were not processed", len(results))
+                raise
+    else:
+        # Sequential execution
+        logger.info("Processing orders sequentially")
+        
+        in_flight = None
+        try:
+            for order in validated_orders():
+                in_flight = order
                 try:
-                    result = future.result()
-                    results.append(result)
+                    result = process_single_order(order, snaptrade, dry_run, ledger)
+                    record(result)
                 except Exception as e:
-                    logger.exception(f"Row {order.row_num}: Unexpected error: {e}")
-                    results.append(OrderResult(
+                    logger.exception("Row %d: Unexpected error: %s", order.row_num, e)
+                    record(OrderResult(
                         row_num=order.row_num,
                         status='FAILED',
                         reason=f"Unexpected error: {str(e)[:200]}"
                     ))
-    else:
-        # Sequential execution
-        logger.info("Processing orders sequentially")
-        
-        for order in validated_orders:
-            try:
-                result = process_single_order(order, snaptrade, dry_run, seen_keys)
-                results.append(result)
-            except Exception as e:
-                logger.exception(f"Row {order.row_num}: Unexpected error: {e}")
-                results.append(OrderResult(
-                    row_num=order.row_num,
+                in_flight = None
+        except KeyboardInterrupt:
+            # A request cut off mid-call can't be cancelled, and the broker may
+            # already have the order, so record it rather than dropping the row
+            if in_flight is not None:
+                logger.warning("Row %d: Interrupted before the broker responded; check the account before re-running", in_flight.row_num)
+                record(OrderResult(
+                    row_num=in_flight.row_num,
                     status='FAILED',
-                    reason=f"Unexpected error: {str(e)[:200]}"
+                    reason="Interrupted before the broker responded; order may have been placed"
                 ))
+            logger.warning("Interrupted after %d row(s); rows not yet read were not processed", len(results))
+            raise
+    
+    if not validated_count:
+        logger.warning("No valid orders to process after validation")
+    else:
+        logger.info("Processed %d validated orders", validated_count)
     
     return results
 
@@ -822,47 +1405,61 @@ def process_orders(
 # OUTPUT & REPORTING (NEW SECTION)
 # ═══════════════════════════════════════════════════════════════════
 
-def write_results_csv(results: List[OrderResult], output_path: Path):
-    """Write execution results to CSV file."""
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['input_row', 'status', 'reason', 'broker_order_id', 'filled_qty']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        
-        writer.writeheader()
-        for result in sorted(results, key=lambda r: r.row_num):
-            writer.writerow(result.to_dict())
+class ResultsWriter:
+    """
+    Write execution results to CSV as they are reported, so finished rows are
+    on disk even if the run is interrupted.
+    """
+    
+    FIELDNAMES = ['input_row', 'status', 'reason', 'broker_order_id', 'filled_qty']
+    BUFFER_SIZE = 1 << 20  # Flushed when the writer closes, including on Ctrl+C
+    
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self._file = None
+        self._writer = None
     
-    logger.info(f"✓ Results written to {output_path}")
+    def __enter__(self) -> 'ResultsWriter':
+        self._file = open(self.output_path, 'w', newline='', encoding='utf-8',
+                          buffering=self.BUFFER_SIZE)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.FIELDNAMES)
+        return self
+    
+    def write(self, result: OrderResult):
+        self._writer.writerow(result.as_row())
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        logger.info("✓ Results written to %s", self.output_path)
 
 
-def print_summary(results: List[OrderResult]):
-    """Print execution summary to console and log."""
-    status_counts = {
-        'PLACED': 0,
-        'VALIDATED': 0,
-        'FAILED': 0,
-        'SKIPPED': 0,
-    }
-    
+def print_summary(results: List[OrderResult]) -> Counter:
+    """Print execution summary to console and log. Returns the status counts."""
+    # One pass for both the counts and the failed rows
+    status_counts = Counter()
+    failed = []
     for result in results:
-        status_counts[result.status] = status_counts.get(result.status, 0) + 1
+        status_counts[result.status] += 1
+        if result.status == 'FAILED':
+            failed.append(result)
     
     print_header("EXECUTION SUMMARY")
-    logger.info(f"Total rows processed:  {len(results)}")
-    logger.info(f"  ✅ PLACED:            {status_counts['PLACED']}")
-    logger.info(f"  ✓ VALIDATED:         {status_counts['VALIDATED']}")
-    logger.info(f"  ❌ FAILED:            {status_counts['FAILED']}")
-    logger.info(f"  - SKIPPED:           {status_counts['SKIPPED']}")
+    logger.info("Total rows processed:  %d", len(results))
+    logger.info("  ✅ PLACED:            %d", status_counts['PLACED'])
+    logger.info("  ✓ VALIDATED:         %d", status_counts['VALIDATED'])
+    logger.info("  ❌ FAILED:            %d", status_counts['FAILED'])
+    logger.info("  - SKIPPED:           %d", status_counts['SKIPPED'])
     logger.info("=" * 70)
     
-    # Log failed rows for easy review
-    if status_counts['FAILED'] > 0:
-        logger.info("")
-        logger.info("FAILED ORDERS:")
-        for result in results:
-            if result.status == 'FAILED':
-                logger.info(f"  Row {result.row_num}: {result.reason}")
-        logger.info("")
+    # Log failed rows for easy review, as a single record
+    if failed and logger.isEnabledFor(logging.INFO):
+        lines = ["", "FAILED ORDERS:"]
+        lines.extend(f"  Row {result.row_num}: {result.reason}" for result in failed)
+        lines.append("")
+        logger.info("\n".join(lines))
+    
+    return status_counts
 
 # ═══════════════════════════════════════════════════════════════════
 # MAIN EXECUTION (UPDATED)
@@ -897,14 +1494,16 @@ def main():
     parser.add_argument('--timeout', type=int, default=30,
                         help='Request timeout in seconds (default: 30)')
     parser.add_argument('--concurrency', type=int, default=1,
-                        help='Number of parallel workers (default: 1, sequential)')
+                        help='Max parallel workers, scaled adaptively (default: 1, sequential)')
+    parser.add_argument('--skip-recent', action='store_true',
+                        help='Skip orders already placed by a run in the last 24 hours')
     
     args = parser.parse_args()
     
     # Header
     print_header("SnapTrade → IBKR Batch Trading Script")
-    logger.info(f"Mode: {'DRY RUN (No actual orders)' if args.dry_run else 'LIVE TRADING'}")
-    logger.info(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("Mode: %s", 'DRY RUN (No actual orders)' if args.dry_run else 'LIVE TRADING')
+    logger.info("Time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
     
     # Step 1: Validate credentials
     validate_credentials()
@@ -914,42 +1513,72 @@ def main():
     snaptrade = SnapTradeManager(
         rate_limit=args.rate_limit,
         timeout=args.timeout,
-        max_retries=args.max_retries
+        max_retries=args.max_retries,
+        pool_size=args.concurrency,
     )
+    atexit.register(snaptrade.close)
     
     if not snaptrade.test_connection():
         return 1
     
     # Step 3: Load orders from CSV
-    logger.info(f"Loading orders from {args.csv}...")
-    raw_orders = load_orders_from_csv(args.csv)
+    logger.info("Loading orders from %s...", args.csv)
+    raw_orders = iter_orders_from_csv(args.csv)
+    first_order = next(raw_orders, None)  # Checks headers before any API work
     
-    if not raw_orders:
+    if first_order is None:
         logger.warning("No orders found in CSV")
         return 0
     
+    snaptrade.warm_connections(args.concurrency)
+    
     # Step 4: Process orders
     if args.dry_run:
         logger.info("*** DRY-RUN MODE *** - Orders will NOT be placed")
     
-    results = process_orders(
-        orders=raw_orders,
-        snaptrade=snaptrade,
-        dry_run=args.dry_run,
-        concurrency=args.concurrency
-    )
+    ledger = None
+    if args.skip_recent:
+        ledger = PlacedOrderLedger(Path('placed_orders.json'))
+        ledger.load()
+    
+    # A file that breaks part-way through stops the feed instead of the run,
+    # so orders already submitted finish and are reported
+    read_errors = []
     
-    # Step 5: Write results to CSV
-    results_path = Path('results.csv')
-    write_results_csv(results, results_path)
+    def orders_until_read_error():
+        try:
+            yield first_order
+            yield from raw_orders
+        except CsvReadError as e:
+            logger.error("%s; finishing the orders already read", e)
+            read_errors.append(e)
+    
+    # Results are written to CSV as each order finishes. On Ctrl+C, the
+    # rows recorded so far and any placed orders are still saved.
+    try:
+        with ResultsWriter(Path('results.csv')) as results_file:
+            results = process_orders(
+                orders=orders_until_read_error(),
+                snaptrade=snaptrade,
+                dry_run=args.dry_run,
+                concurrency=args.concurrency,
+                ledger=ledger,
+                on_result=results_file.write
+            )
+    finally:
+        if ledger is not None and not args.dry_run:
+            ledger.save()
     
-    # Step 6: Print summary
-    print_summary(results)
+    # Step 5: Print summary
+    status_counts = print_summary(results)
     
-    # Step 7: Exit with error code if any failures
-    failed_count = sum(1 for r in results if r.status == 'FAILED')
+    # Step 6: Exit with error code if any failures
+    failed_count = status_counts['FAILED']
     if failed_count > 0:
-        logger.error(f"Exiting with error: {failed_count} orders failed")
+        logger.error("Exiting with error: %d orders failed", failed_count)
+        return 1
+    if read_errors:
+        logger.error("Exiting with error: %s was not read to the end", args.csv)
         return 1
     
     logger.info("✅ All orders processed successfully")